@@ -5,28 +5,255 @@ Portfolio Manager App - Updated Version for Student Portfolio
 Supports management of education modules, thesis, courseworks, and practical works
 """
 
+import copy
 import json
+import logging
+import mmap
 import os
 import sys
 import subprocess
 import threading
 import webbrowser
-from datetime import datetime
-from typing import List, Dict, Any
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
 
 # PyQt6 import (required for this UI)
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
-        QTableWidget, QTableWidgetItem, QStackedWidget, QDialog, QLineEdit, QTextEdit, QFormLayout,
+        QTableView, QStackedWidget, QDialog, QLineEdit, QPlainTextEdit, QFormLayout,
         QComboBox, QDialogButtonBox, QMessageBox, QProgressBar, QTabWidget, QListWidget, QListWidgetItem,
-        QSplitter, QInputDialog
+        QListView, QSplitter, QInputDialog, QButtonGroup
+    )
+    from PyQt6.QtCore import (
+        Qt, pyqtSignal, QObject, QTimer, QRunnable, QThreadPool, QAbstractListModel, QAbstractTableModel, QModelIndex
     )
-    from PyQt6.QtCore import Qt, pyqtSignal, QObject, QThread, pyqtSlot
     from PyQt6.QtGui import QCursor
 except Exception as e:
     sys.exit("PyQt6 is required: {}".format(e))
 
+# orjson is optional: it is several times faster than the stdlib encoder,
+# but the app must keep working on a bare Python install.
+# The data files are read by the site, not by people, so they are written
+# compact unless pretty output is asked for
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+except ImportError:
+    orjson = None
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# pygit2 is optional: with it, deploy stages and commits in-process instead of
+# spawning a git process per step
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+_GITHUB_REMOTE_URL = "https://github.com/NSODAT/developer-portfolio.git"
+
+# Files above this size are parsed straight from a memory map; below it the
+# mmap setup costs more than a plain read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# Доля выполнения деплоя (в процентах) в начале каждого шага git
+_DEPLOY_STAGES = {"add": 20, "commit": 40, "push": 70}
+
+# Default contents of the data files, serialized once at import and written
+# as-is when a file is missing
+_DEFAULT_EDUCATION_MODULES_BYTES = _json_dumps([
+    {
+        "id": 1,
+        "title": "Модуль 1: Основы программирования",
+        "semesters": [
+            {
+                "id": 1,
+                "title": "Семестр 1",
+                "labs": [
+                    {"id": 1, "title": "ЛР1: Введение в алгоритмы", "link": "#"},
+                    {"id": 2, "title": "ЛР2: Основы Python", "link": "#"},
+                    {"id": 3, "title": "ЛР3: Структуры данных", "link": "#"}
+                ]
+            }
+        ]
+    }
+])
+
+_DEFAULT_THESIS_BYTES = _json_dumps({
+    "title": "Дипломная работа",
+    "topic": "Разработка веб-приложения для управления учебными проектами",
+    "description": "Моя дипломная работа посвящена созданию современного веб-приложения для управления учебными проектами студентов.",
+    "previewImage": "/thesis-preview.jpg",
+    "link": "#",
+    "keyFeatures": [
+        "Анализ требований",
+        "Проектирование архитектуры",
+        "Реализация основных модулей",
+        "Тестирование и оптимизация"
+    ]
+})
+
+_DEFAULT_COURSEWORKS_BYTES = _json_dumps([
+    {
+        "id": 1,
+        "title": "Курсовая работа по базам данных",
+        "semester": "Семестр 3",
+        "description": "Разработка системы управления учебными проектами с использованием реляционных баз данных.",
+        "link": "#",
+        "technologies": ["PostgreSQL", "SQL", "Python"]
+    }
+])
+
+_DEFAULT_PRACTICAL_WORKS_BYTES = _json_dumps([
+    {
+        "id": 1,
+        "title": "Практические работы по программированию",
+        "semester": "Семестр 1-2",
+        "description": "Коллекция практических работ по основам программирования.",
+        "link": "#",
+        "items": [
+            "Практика 1: Основы Python",
+            "Практика 2: Работа с файлами",
+            "Практика 3: Алгоритмы сортировки"
+        ]
+    }
+])
+
+# Log levels accepted by PortfolioManager.log; SUCCESS sits between INFO and WARNING
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+_LOG_LEVELS = {
+    "INFO": logging.INFO,
+    "SUCCESS": SUCCESS,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+class ColoredFormatter(logging.Formatter):
+    """Console formatter that prints `[HH:MM:SS] message` in the level's ANSI color"""
+    COLORS = {
+        "INFO": "\033[94m",
+        "SUCCESS": "\033[92m",
+        "WARNING": "\033[93m",
+        "ERROR": "\033[91m",
+    }
+    RESET = "\033[0m"
+
+    def __init__(self):
+        super().__init__("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{self.COLORS.get(record.levelname, '')}{super().format(record)}{self.RESET}"
+
+class _LogSignals(QObject):
+    message = pyqtSignal(str)
+
+class QtLogHandler(logging.Handler):
+    """Logging handler that forwards formatted records to the GUI through a Qt signal"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _LogSignals()
+
+    def emit(self, record: logging.LogRecord):
+        # Signals are queued across threads, so records from the deploy worker are safe
+        self.signals.message.emit(self.format(record))
+
+def _load_json(path: str, size: int) -> Any:
+    """Parse a JSON data file from disk"""
+    # The stdlib parser cannot consume a buffer, so mmap only pays off with orjson
+    if orjson is None or size <= _MMAP_THRESHOLD:
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _json_loads(view)
+    finally:
+        os.close(fd)
+
+def _write_bytes(path: str, data_bytes: bytes) -> None:
+    """Atomically replace a file with the given bytes"""
+    tmp_path = path + ".tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # The data file is swapped in whole, so a crash never leaves it torn
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class _JsonFile:
+    """One JSON data file: reads are served from the last parse while the
+    file's mtime and size are unchanged, writes replace the file atomically.
+    The returned data is shared with the cache and must not be mutated"""
+    __slots__ = ("path", "default", "empty", "label", "log", "_key", "_data")
+
+    def __init__(self, path: str, default: bytes, empty: type, label: str,
+                 log: Callable[[str, str], None]):
+        self.path = path
+        self.default = default  # serialized contents for a missing file
+        self.empty = empty      # list or dict, returned when the file can't be read
+        self.label = label      # genitive name used in error messages
+        self.log = log
+        self._key = None
+        self._data = None
+
+    def read(self) -> Any:
+        try:
+            st = os.stat(self.path)
+            key = (st.st_mtime_ns, st.st_size)
+            if key != self._key:
+                self._data = _load_json(self.path, st.st_size)
+                self._key = key
+            return self._data
+        except Exception as e:
+            self.log(f"Ошибка чтения {self.label}: {e}", "ERROR")
+            return self.empty()
+
+    def write(self, data: Any, pretty: bool = False) -> bool:
+        # Drop the cached parse first: if the write fails part-way the next
+        # read goes back to disk instead of trusting the old entry
+        self.invalidate()
+        try:
+            _write_bytes(self.path, _json_dumps(data, pretty))
+            st = os.stat(self.path)
+            self._key = (st.st_mtime_ns, st.st_size)
+            self._data = data
+            return True
+        except Exception as e:
+            self.log(f"Ошибка записи {self.label}: {e}", "ERROR")
+            return False
+
+    def invalidate(self):
+        self._key = None
+        self._data = None
+
 class PortfolioManager:
     def __init__(self, repo_path: str = "."):
         self.repo_path = os.path.abspath(repo_path)
@@ -40,218 +267,400 @@ class PortfolioManager:
         self.courseworks_file = os.path.join(self.data_dir, "courseworks.json")
         self.practical_works_file = os.path.join(self.data_dir, "practical_works.json")
 
+        self._logger = logging.getLogger("portfolio")
+
+        self.education_modules = _JsonFile(self.education_modules_file, _DEFAULT_EDUCATION_MODULES_BYTES,
+                                           list, "учебных модулей", self.log)
+        self.thesis = _JsonFile(self.thesis_file, _DEFAULT_THESIS_BYTES,
+                                dict, "дипломной работы", self.log)
+        self.courseworks = _JsonFile(self.courseworks_file, _DEFAULT_COURSEWORKS_BYTES,
+                                     list, "курсовых работ", self.log)
+        self.practical_works = _JsonFile(self.practical_works_file, _DEFAULT_PRACTICAL_WORKS_BYTES,
+                                         list, "практических работ", self.log)
+        self._data_files = (self.education_modules, self.thesis, self.courseworks, self.practical_works)
+
         # Initialize default data files if they don't exist
         self._initialize_default_files()
 
     def _initialize_default_files(self):
         """Initialize default JSON files if they don't exist"""
-        default_files = {
-            self.education_modules_file: [
-                {
-                    "id": 1,
-                    "title": "Модуль 1: Основы программирования",
-                    "semesters": [
-                        {
-                            "id": 1,
-                            "title": "Семестр 1",
-                            "labs": [
-                                {"id": 1, "title": "ЛР1: Введение в алгоритмы", "link": "#"},
-                                {"id": 2, "title": "ЛР2: Основы Python", "link": "#"},
-                                {"id": 3, "title": "ЛР3: Структуры данных", "link": "#"}
-                            ]
-                        }
-                    ]
-                }
-            ],
-            self.thesis_file: {
-                "title": "Дипломная работа",
-                "topic": "Разработка веб-приложения для управления учебными проектами",
-                "description": "Моя дипломная работа посвящена созданию современного веб-приложения для управления учебными проектами студентов.",
-                "previewImage": "/thesis-preview.jpg",
-                "link": "#",
-                "keyFeatures": [
-                    "Анализ требований",
-                    "Проектирование архитектуры",
-                    "Реализация основных модулей",
-                    "Тестирование и оптимизация"
-                ]
-            },
-            self.courseworks_file: [
-                {
-                    "id": 1,
-                    "title": "Курсовая работа по базам данных",
-                    "semester": "Семестр 3",
-                    "description": "Разработка системы управления учебными проектами с использованием реляционных баз данных.",
-                    "link": "#",
-                    "technologies": ["PostgreSQL", "SQL", "Python"]
-                }
-            ],
-            self.practical_works_file: [
-                {
-                    "id": 1,
-                    "title": "Практические работы по программированию",
-                    "semester": "Семестр 1-2",
-                    "description": "Коллекция практических работ по основам программирования.",
-                    "link": "#",
-                    "items": [
-                        "Практика 1: Основы Python",
-                        "Практика 2: Работа с файлами",
-                        "Практика 3: Алгоритмы сортировки"
-                    ]
-                }
-            ]
-        }
-
-        for file_path, default_data in default_files.items():
-            if not os.path.exists(file_path):
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(default_data, f, ensure_ascii=False, indent=2)
+        # One directory listing instead of a stat call per file
+        with os.scandir(self.data_dir) as entries:
+            existing = {entry.name for entry in entries}
+        for data_file in self._data_files:
+            if os.path.basename(data_file.path) not in existing:
+                _write_bytes(data_file.path, data_file.default)
 
     def log(self, message: str, level: str = "INFO"):
-        colors = {
-            "INFO": "\033[94m",
-            "SUCCESS": "\033[92m",
-            "WARNING": "\033[93m",
-            "ERROR": "\033[91m",
-            "RESET": "\033[0m",
-        }
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"{colors[level]}[{timestamp}] {message}{colors['RESET']}")
+        self._logger.log(_LOG_LEVELS[level], message)
+
+    def invalidate(self, path: str | None = None):
+        """Drop the cached data for one file, or for all files if no path is given"""
+        for data_file in self._data_files:
+            if path is None or data_file.path == path:
+                data_file.invalidate()
+
+    def _git(self, *args: str) -> subprocess.CompletedProcess:
+        """Run a git command against the repository without changing the process cwd"""
+        return subprocess.run(["git", "-C", self.repo_path, *args],
+                              capture_output=True, text=True, encoding='utf-8')
+
+    def _pending_work(self) -> tuple[bool, bool]:
+        """Return (uncommitted changes, unpushed commits) from a single git status call"""
+        result = self._git("status", "--porcelain=v2", "--branch", "-z")
+        if result.returncode != 0:
+            # Let the regular command chain run and report the error
+            return True, True
+
+        uncommitted = False
+        unpushed = True  # a branch without upstream has never been pushed
+        for entry in result.stdout.split("\0"):
+            if entry.startswith("# branch.ab "):
+                unpushed = not entry.startswith("# branch.ab +0 ")
+            elif entry and not entry.startswith("# "):
+                uncommitted = True
+        return uncommitted, unpushed
+
+    def _commit_with_pygit2(self, commit_message: str, report: Callable[..., None]):
+        """Initialize the repository if needed, stage everything and commit it via libgit2"""
+        if os.path.exists(os.path.join(self.repo_path, '.git')):
+            repo = pygit2.Repository(self.repo_path)
+        else:
+            report("Git репозиторий не инициализирован. Инициализируем...", "WARNING")
+            repo = pygit2.init_repository(self.repo_path, initial_head="main")
+
+        if "origin" not in repo.remotes.names():
+            report("Remote origin не настроен. Добавляем...", "WARNING")
+            repo.remotes.create("origin", _GITHUB_REMOTE_URL)
+
+        # Equivalent of `git add .`: stage new and modified files, drop deleted ones
+        report("Выполняем: git add .", "INFO", _DEPLOY_STAGES["add"])
+        index = repo.index
+        index.add_all()
+        for path, flags in repo.status().items():
+            if flags & pygit2.GIT_STATUS_WT_DELETED:
+                index.remove(path)
+        index.write()
+        tree = index.write_tree()
+
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        if parents and repo[parents[0]].tree_id == tree:
+            report("Нет изменений для коммита", "WARNING")
+            return
 
-    # Education Modules Management
-    def read_education_modules(self) -> List[Dict[str, Any]]:
-        try:
-            with open(self.education_modules_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.log(f"Ошибка чтения учебных модулей: {e}", "ERROR")
-            return []
+        report(f"Выполняем: git commit -m {commit_message}", "INFO", _DEPLOY_STAGES["commit"])
+        signature = repo.default_signature
+        repo.create_commit("HEAD", signature, signature, commit_message, tree, parents)
 
-    def write_education_modules(self, modules: List[Dict[str, Any]]) -> bool:
-        try:
-            with open(self.education_modules_file, 'w', encoding='utf-8') as f:
-                json.dump(modules, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            self.log(f"Ошибка записи учебных модулей: {e}", "ERROR")
-            return False
+    def deploy_to_github(self, commit_message: str = "Update portfolio content",
+                         progress: Callable[[int, str], None] | None = None) -> bool:
+        percent = 0
 
-    # Thesis Management
-    def read_thesis(self) -> Dict[str, Any]:
-        try:
-            with open(self.thesis_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.log(f"Ошибка чтения дипломной работы: {e}", "ERROR")
-            return {}
+        def report(message: str, level: str = "INFO", stage: int | None = None):
+            nonlocal percent
+            self.log(message, level)
+            if stage is not None:
+                percent = stage
+            if progress is not None:
+                progress(percent, message)
 
-    def write_thesis(self, thesis_data: Dict[str, Any]) -> bool:
         try:
-            with open(self.thesis_file, 'w', encoding='utf-8') as f:
-                json.dump(thesis_data, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            self.log(f"Ошибка записи дипломной работы: {e}", "ERROR")
-            return False
-
-    # Courseworks Management
-    def read_courseworks(self) -> List[Dict[str, Any]]:
-        try:
-            with open(self.courseworks_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.log(f"Ошибка чтения курсовых работ: {e}", "ERROR")
-            return []
+            # Если коммитить и пушить нечего, не запускаем цепочку команд вовсе
+            uncommitted = True
+            if os.path.exists(os.path.join(self.repo_path, '.git')):
+                uncommitted, unpushed = self._pending_work()
+                if not uncommitted and not unpushed:
+                    report("Нет изменений для загрузки", "SUCCESS", 100)
+                    return True
+
+            if pygit2 is not None:
+                # Staging and committing happen in-process; push stays on the git CLI
+                # so the user's credential helper is used
+                self._commit_with_pygit2(commit_message, report)
+                commands = [
+                    ["push", "-u", "origin", "main"]
+                ]
+            else:
+                # Проверяем, инициализирован ли git
+                if not os.path.exists(os.path.join(self.repo_path, '.git')):
+                    report("Git репозиторий не инициализирован. Инициализируем...", "WARNING")
+                    self._git("init")
 
-    def write_courseworks(self, courseworks: List[Dict[str, Any]]) -> bool:
-        try:
-            with open(self.courseworks_file, 'w', encoding='utf-8') as f:
-                json.dump(courseworks, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            self.log(f"Ошибка записи курсовых работ: {e}", "ERROR")
-            return False
+                    # Добавляем remote origin
+                    self._git("remote", "add", "origin", _GITHUB_REMOTE_URL)
 
-    # Practical Works Management
-    def read_practical_works(self) -> List[Dict[str, Any]]:
-        try:
-            with open(self.practical_works_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.log(f"Ошибка чтения практических работ: {e}", "ERROR")
-            return []
+                    # Создаем ветку main
+                    self._git("branch", "-M", "main")
 
-    def write_practical_works(self, practical_works: List[Dict[str, Any]]) -> bool:
-        try:
-            with open(self.practical_works_file, 'w', encoding='utf-8') as f:
-                json.dump(practical_works, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            self.log(f"Ошибка записи практических работ: {e}", "ERROR")
-            return False
+                # Проверяем наличие remote origin
+                result = self._git("remote", "get-url", "origin")
+                if result.returncode != 0:
+                    report("Remote origin не настроен. Добавляем...", "WARNING")
+                    self._git("remote", "add", "origin", _GITHUB_REMOTE_URL)
+
+                # Выполняем команды git
+                commands = [
+                    ["add", "."],
+                    ["commit", "-m", commit_message],
+                    ["push", "-u", "origin", "main"]  # Добавлен флаг -u для первого push
+                ]
+                if not uncommitted:
+                    # Остались только незапушенные коммиты
+                    commands = commands[2:]
 
-    def deploy_to_github(self, commit_message: str = "Update portfolio content") -> bool:
-        try:
-            os.chdir(self.repo_path)
-            
-            # Проверяем, инициализирован ли git
-            if not os.path.exists('.git'):
-                self.log("Git репозиторий не инициализирован. Инициализируем...", "WARNING")
-                subprocess.run(["git", "init"], capture_output=True)
-                
-                # Добавляем remote origin
-                remote_url = "https://github.com/NSODAT/developer-portfolio.git"
-                subprocess.run(["git", "remote", "add", "origin", remote_url], capture_output=True)
-                
-                # Создаем ветку main
-                subprocess.run(["git", "branch", "-M", "main"], capture_output=True)
-            
-            # Проверяем наличие remote origin
-            result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True)
-            if result.returncode != 0:
-                self.log("Remote origin не настроен. Добавляем...", "WARNING")
-                remote_url = "https://github.com/NSODAT/developer-portfolio.git"
-                subprocess.run(["git", "remote", "add", "origin", remote_url], capture_output=True)
-            
-            # Выполняем команды git
-            commands = [
-                ["git", "add", "."],
-                ["git", "commit", "-m", commit_message],
-                ["git", "push", "-u", "origin", "main"]  # Добавлен флаг -u для первого push
-            ]
-            
             for cmd in commands:
-                self.log(f"Выполняем: {' '.join(cmd)}", "INFO")
-                result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+                report(f"Выполняем: git {' '.join(cmd)}", "INFO", _DEPLOY_STAGES[cmd[0]])
+                result = self._git(*cmd)
                 
                 if result.returncode != 0:
-                    # Если это ошибка "nothing to commit", это не критично
-                    if "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
-                        self.log("Нет изменений для коммита", "WARNING")
-                        continue
                     # Если ошибка с веткой, пробуем создать и push
-                    elif "error: src refspec main does not match any" in result.stderr:
-                        self.log("Создаем ветку main...", "WARNING")
-                        subprocess.run(["git", "checkout", "-b", "main"], capture_output=True)
+                    if "error: src refspec main does not match any" in result.stderr:
+                        report("Создаем ветку main...", "WARNING")
+                        self._git("checkout", "-b", "main")
                         continue
                     else:
-                        self.log(f"Ошибка выполнения {cmd[0]}: {result.stderr}", "ERROR")
+                        report(f"Ошибка выполнения git {cmd[0]}: {result.stderr}", "ERROR")
                         return False
                         
-            self.log("Изменения успешно загружены в GitHub!", "SUCCESS")
+            report("Изменения успешно загружены в GitHub!", "SUCCESS", 100)
             return True
         
         except Exception as e:
-            self.log(f"Ошибка деплоя: {e}", "ERROR")
+            report(f"Ошибка деплоя: {e}", "ERROR")
             return False
 
+@contextmanager
+def _batch_update(container: QWidget, *inputs: QWidget):
+    """Hold container repaints and the inputs' change signals while widgets are updated in bulk"""
+    updates_enabled = container.updatesEnabled()
+    container.setUpdatesEnabled(False)
+    blocked = [w.blockSignals(True) for w in inputs]
+    try:
+        yield
+    finally:
+        for w, was_blocked in zip(inputs, blocked):
+            w.blockSignals(was_blocked)
+        container.setUpdatesEnabled(updates_enabled)
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+class _RowListModel(QAbstractListModel):
+    """List model over a Python list of dicts, shared with the data it displays.
+    Rows are labelled PREFIX + title; plain concatenation is cheaper than an f-string"""
+    PREFIX = ""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        # Called for every visible row and role on each repaint: test the
+        # cheap role check first
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return self.PREFIX + self._rows[index.row()]['title']
+
+    def append_row(self, item: Dict[str, Any]) -> QModelIndex:
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(item)
+        self.endInsertRows()
+        return self.index(row)
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._rows.pop(row)
+        self.endRemoveRows()
+
+    def row_changed(self, row: int):
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+class SemesterListModel(_RowListModel):
+    PREFIX = "📋 "
+
+class LabListModel(_RowListModel):
+    PREFIX = "🧪 "
+
+class PortfolioListModel(QAbstractTableModel):
+    """Table model over a list of dicts; each column is a (header, getter, width) triple"""
+
+    def __init__(self, columns: List[tuple[str, Callable[[Dict[str, Any]], str], int | None]], parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._rows: List[Dict[str, Any]] = []
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        # Unchanged data: keep the view (and its selection) as it is
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return self._columns[index.column()][1](self._rows[index.row()])
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != _DISPLAY_ROLE or orientation != Qt.Orientation.Horizontal:
+            return None
+        return self._columns[section][0]
+
+def _fill_table(table: QTableView, model: PortfolioListModel, rows: List[Dict[str, Any]]):
+    """Load rows into a table; alternating row colors are switched on after the first fill"""
+    model.set_rows(rows)
+    if not table.alternatingRowColors():
+        table.setAlternatingRowColors(True)
+
+def _size_columns(table: QTableView, columns: List[tuple]):
+    """Set the starting widths; the last column stretches, so it has none"""
+    for col, (_, _, width) in enumerate(columns[:-1]):
+        table.setColumnWidth(col, width)
+
+_EDUCATION_COLUMNS = [
+    ("Название модуля", lambda m: m.get("title", ""), 280),
+    ("Количество семестров", lambda m: str(len(m.get("semesters", []))), None),
+]
+_COURSEWORK_COLUMNS = [
+    ("Название", lambda cw: cw.get("title", ""), 280),
+    ("Семестр", lambda cw: cw.get("semester", ""), 120),
+    ("Технологии", lambda cw: ", ".join(cw.get("technologies", [])), None),
+]
+_PRACTICAL_COLUMNS = [
+    ("Название", lambda pw: pw.get("title", ""), 280),
+    ("Семестр", lambda pw: pw.get("semester", ""), 120),
+    ("Количество работ", lambda pw: str(len(pw.get("items", []))), None),
+]
+
+# EducationModuleDialog is styled by one sheet set on the dialog and matched by
+# object name, so Qt parses the rules once instead of once per widget
+_DIALOG_QSS = """
+    QLineEdit#titleInput {
+        font-size: 18px;
+        font-weight: bold;
+        padding: 12px;
+        border: 2px solid #334155;
+        border-radius: 8px;
+        background: #0b1220;
+        color: #e2e8f0;
+    }
+    QLineEdit#titleInput:focus {
+        border-color: #60a5fa;
+    }
+    QLineEdit#semesterTitleInput {
+        padding: 10px;
+        border: 1px solid #334155;
+        border-radius: 6px;
+        background: #111827;
+        color: #e2e8f0;
+    }
+    QLineEdit#labTitleInput, QLineEdit#labLinkInput {
+        padding: 8px;
+        border: 1px solid #334155;
+        border-radius: 6px;
+        background: #111827;
+        color: #e2e8f0;
+    }
+    QLabel#detailsTitle {
+        font-weight: bold;
+        color: #94a3b8;
+    }
+    QListView#semesterList, QListView#labsList {
+        background: #0b1220;
+        border: 1px solid #334155;
+        border-radius: 8px;
+        padding: 5px;
+    }
+    QListView#semesterList::item {
+        padding: 10px;
+        border-bottom: 1px solid #1e293b;
+    }
+    QListView#semesterList::item:selected {
+        background: #1e293b;
+        border-left: 3px solid #60a5fa;
+    }
+    QListView#labsList::item {
+        padding: 8px;
+        border-bottom: 1px solid #1e293b;
+    }
+    QPushButton#addSemesterButton, QPushButton#deleteSemesterButton {
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+    QPushButton#addLabButton, QPushButton#deleteLabButton {
+        color: white;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-size: 12px;
+    }
+    QPushButton#saveButton, QPushButton#cancelButton {
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton#addSemesterButton, QPushButton#saveButton {
+        background: #22c55e;
+    }
+    QPushButton#addSemesterButton:hover, QPushButton#saveButton:hover {
+        background: #16a34a;
+    }
+    QPushButton#deleteSemesterButton, QPushButton#deleteLabButton {
+        background: #ef4444;
+    }
+    QPushButton#deleteSemesterButton:hover, QPushButton#deleteLabButton:hover {
+        background: #dc2626;
+    }
+    QPushButton#addLabButton {
+        background: #3b82f6;
+    }
+    QPushButton#addLabButton:hover {
+        background: #2563eb;
+    }
+    QPushButton#cancelButton {
+        background: #64748b;
+    }
+    QPushButton#cancelButton:hover {
+        background: #475569;
+    }
+"""
+
 class EducationModuleDialog(QDialog):
     def __init__(self, parent=None, title: str = "", module_data: Dict[str, Any] | None = None):
         super().__init__(parent)
-        self.setWindowTitle(title)
         self.setModal(True)
         self.resize(1000, 700)
         self.setMinimumSize(800, 600)
+        self.setStyleSheet(_DIALOG_QSS)
+
+        # Edits in the detail inputs are saved once typing pauses, not on every keystroke
+        self._pending_save = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(150)
+        self._save_timer.timeout.connect(self._flush_pending_save)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -263,21 +672,7 @@ class EducationModuleDialog(QDialog):
         header_layout.addWidget(QLabel("📚"), alignment=Qt.AlignmentFlag.AlignTop)
         self.title_input = QLineEdit()
         self.title_input.setPlaceholderText("Введите название модуля...")
-        self.title_input.setStyleSheet("""
-            QLineEdit {
-                font-size: 18px;
-                font-weight: bold;
-                padding: 12px;
-                border: 2px solid #334155;
-                border-radius: 8px;
-                background: #0b1220;
-                color: #e2e8f0;
-            }
-            QLineEdit:focus {
-                border-color: #60a5fa;
-            }
-        """)
-        self.title_input.setText(module_data.get("title", "") if module_data else "")
+        self.title_input.setObjectName("titleInput")
         header_layout.addWidget(self.title_input, 1)
         main_layout.addLayout(header_layout)
 
@@ -293,42 +688,17 @@ class EducationModuleDialog(QDialog):
         semester_header = QHBoxLayout()
         semester_header.addWidget(QLabel("📋 Разделы"), alignment=Qt.AlignmentFlag.AlignLeft)
         add_semester_btn = QPushButton("➕ Добавить раздел")
-        add_semester_btn.setStyleSheet("""
-            QPushButton {
-                background: #22c55e;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #16a34a;
-            }
-        """)
+        add_semester_btn.setObjectName("addSemesterButton")
         add_semester_btn.clicked.connect(self._add_semester)
         semester_header.addWidget(add_semester_btn, alignment=Qt.AlignmentFlag.AlignRight)
         left_layout.addLayout(semester_header)
 
         # Semester list
-        self.semester_list = QListWidget()
-        self.semester_list.setStyleSheet("""
-            QListWidget {
-                background: #0b1220;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 10px;
-                border-bottom: 1px solid #1e293b;
-            }
-            QListWidget::item:selected {
-                background: #1e293b;
-                border-left: 3px solid #60a5fa;
-            }
-        """)
-        self.semester_list.itemClicked.connect(self._on_semester_selected)
+        self.semester_model = SemesterListModel(self)
+        self.semester_list = QListView()
+        self.semester_list.setObjectName("semesterList")
+        self.semester_list.setModel(self.semester_model)
+        self.semester_list.clicked.connect(self._on_semester_selected)
         left_layout.addWidget(self.semester_list)
 
         # Semester controls
@@ -337,19 +707,7 @@ class EducationModuleDialog(QDialog):
         self.edit_semester_btn.setEnabled(False)
         self.delete_semester_btn = QPushButton("🗑️ Удалить")
         self.delete_semester_btn.setEnabled(False)
-        self.delete_semester_btn.setStyleSheet("""
-            QPushButton {
-                background: #ef4444;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #dc2626;
-            }
-        """)
+        self.delete_semester_btn.setObjectName("deleteSemesterButton")
         
         self.edit_semester_btn.clicked.connect(self._edit_semester)
         self.delete_semester_btn.clicked.connect(self._delete_semester)
@@ -366,23 +724,15 @@ class EducationModuleDialog(QDialog):
         # Details header
         details_header = QHBoxLayout()
         self.details_title = QLabel("Выберите раздел для редактирования")
-        self.details_title.setStyleSheet("font-weight: bold; color: #94a3b8;")
+        self.details_title.setObjectName("detailsTitle")
         details_header.addWidget(self.details_title)
         right_layout.addLayout(details_header)
 
         # Semester title input
         self.semester_title_input = QLineEdit()
         self.semester_title_input.setPlaceholderText("Название раздела...")
-        self.semester_title_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid #334155;
-                border-radius: 6px;
-                background: #111827;
-                color: #e2e8f0;
-            }
-        """)
-        self.semester_title_input.textChanged.connect(self._save_current_semester)
+        self.semester_title_input.setObjectName("semesterTitleInput")
+        self.semester_title_input.textChanged.connect(lambda: self._schedule_save("semester"))
         right_layout.addWidget(QLabel("Название раздела:"))
         right_layout.addWidget(self.semester_title_input)
 
@@ -390,37 +740,16 @@ class EducationModuleDialog(QDialog):
         labs_header = QHBoxLayout()
         labs_header.addWidget(QLabel("🧪 Лабораторные работы"))
         add_lab_btn = QPushButton("➕ Добавить лабораторную работу")
-        add_lab_btn.setStyleSheet("""
-            QPushButton {
-                background: #3b82f6;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: #2563eb;
-            }
-        """)
+        add_lab_btn.setObjectName("addLabButton")
         add_lab_btn.clicked.connect(self._add_lab)
         labs_header.addWidget(add_lab_btn)
         right_layout.addLayout(labs_header)
 
-        self.labs_list = QListWidget()
-        self.labs_list.setStyleSheet("""
-            QListWidget {
-                background: #0b1220;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #1e293b;
-            }
-        """)
-        self.labs_list.itemClicked.connect(self._on_lab_selected)
+        self.lab_model = LabListModel(self)
+        self.labs_list = QListView()
+        self.labs_list.setObjectName("labsList")
+        self.labs_list.setModel(self.lab_model)
+        self.labs_list.clicked.connect(self._on_lab_selected)
         right_layout.addWidget(self.labs_list)
 
         # Lab details
@@ -429,29 +758,13 @@ class EducationModuleDialog(QDialog):
         
         self.lab_title_input = QLineEdit()
         self.lab_title_input.setPlaceholderText("Название лабораторной работы...")
-        self.lab_title_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #334155;
-                border-radius: 6px;
-                background: #111827;
-                color: #e2e8f0;
-            }
-        """)
-        self.lab_title_input.textChanged.connect(self._save_current_lab)
+        self.lab_title_input.setObjectName("labTitleInput")
+        self.lab_title_input.textChanged.connect(lambda: self._schedule_save("lab"))
         
         self.lab_link_input = QLineEdit()
         self.lab_link_input.setPlaceholderText("Ссылка на работу...")
-        self.lab_link_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #334155;
-                border-radius: 6px;
-                background: #111827;
-                color: #e2e8f0;
-            }
-        """)
-        self.lab_link_input.textChanged.connect(self._save_current_lab)
+        self.lab_link_input.setObjectName("labLinkInput")
+        self.lab_link_input.textChanged.connect(lambda: self._schedule_save("lab"))
 
         lab_details_layout.addWidget(QLabel("Название:"))
         lab_details_layout.addWidget(self.lab_title_input)
@@ -462,19 +775,7 @@ class EducationModuleDialog(QDialog):
         lab_controls = QHBoxLayout()
         self.delete_lab_btn = QPushButton("🗑️ Удалить лабораторную работу")
         self.delete_lab_btn.setEnabled(False)
-        self.delete_lab_btn.setStyleSheet("""
-            QPushButton {
-                background: #ef4444;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: #dc2626;
-            }
-        """)
+        self.delete_lab_btn.setObjectName("deleteLabButton")
         self.delete_lab_btn.clicked.connect(self._delete_lab)
         lab_controls.addWidget(self.delete_lab_btn)
         lab_details_layout.addLayout(lab_controls)
@@ -490,37 +791,11 @@ class EducationModuleDialog(QDialog):
         # Buttons
         buttons_layout = QHBoxLayout()
         self.save_btn = QPushButton("💾 Сохранить модуль")
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background: #22c55e;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #16a34a;
-            }
-        """)
+        self.save_btn.setObjectName("saveButton")
         self.save_btn.clicked.connect(self.accept)
         
         cancel_btn = QPushButton("❌ Отмена")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: #64748b;
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #475569;
-            }
-        """)
+        cancel_btn.setObjectName("cancelButton")
         cancel_btn.clicked.connect(self.reject)
 
         buttons_layout.addStretch()
@@ -529,22 +804,40 @@ class EducationModuleDialog(QDialog):
         main_layout.addLayout(buttons_layout)
 
         # Initialize data
-        self.current_module_data = module_data or {"title": "", "semesters": []}
+        self.reset(title, module_data)
+
+    def reset(self, title: str, module_data: Dict[str, Any] | None = None):
+        """Load a module into the dialog, reusing the already built widgets"""
+        self.setWindowTitle(title)
+        # A pending save belongs to the previous module
+        self._save_timer.stop()
+        self._pending_save = None
+
+        # Edited on a private copy so the caller can tell whether anything changed
+        self.current_module_data = copy.deepcopy(module_data) if module_data else {"title": "", "semesters": []}
         self.current_semester_index = -1
         self.current_lab_index = -1
-        
-        self._populate_semester_list()
-        if self.semester_list.count() > 0:
-            self.semester_list.setCurrentRow(0)
-            self._on_semester_selected(self.semester_list.item(0))
+
+        with _batch_update(self, self.semester_title_input, self.lab_title_input, self.lab_link_input):
+            self.title_input.setText(self.current_module_data.get("title", ""))
+            self.details_title.setText("Выберите раздел для редактирования")
+            self.semester_title_input.clear()
+            self.lab_title_input.clear()
+            self.lab_link_input.clear()
+            self.edit_semester_btn.setEnabled(False)
+            self.delete_semester_btn.setEnabled(False)
+            self.delete_lab_btn.setEnabled(False)
+            
+            self._populate_semester_list()
+            self._populate_labs_list()
+            if self.semester_model.rowCount() > 0:
+                first = self.semester_model.index(0)
+                self.semester_list.setCurrentIndex(first)
+                self._on_semester_selected(first)
 
     def _populate_semester_list(self):
         """Populate the semester list from module data"""
-        self.semester_list.clear()
-        for i, semester in enumerate(self.current_module_data.get("semesters", [])):
-            item = QListWidgetItem(f"📋 {semester.get('title', f'Раздел {i+1}')}")
-            item.setData(Qt.ItemDataRole.UserRole, i)
-            self.semester_list.addItem(item)
+        self.semester_model.set_rows(self.current_module_data.setdefault("semesters", []))
 
     def _add_semester(self):
         """Add a new semester"""
@@ -553,21 +846,18 @@ class EducationModuleDialog(QDialog):
             "title": f"Новый раздел {len(self.current_module_data['semesters']) + 1}",
             "labs": []
         }
-        self.current_module_data["semesters"].append(new_semester)
-        
-        # Update list
-        self._populate_semester_list()
+        new_index = self.semester_model.append_row(new_semester)
         
         # Select the new semester
-        new_item = self.semester_list.item(self.semester_list.count() - 1)
-        self.semester_list.setCurrentItem(new_item)
-        self._on_semester_selected(new_item)
+        self.semester_list.setCurrentIndex(new_index)
+        self._on_semester_selected(new_index)
 
     def _edit_semester(self):
         """Edit selected semester"""
-        current_item = self.semester_list.currentItem()
-        if current_item:
-            semester_index = current_item.data(Qt.ItemDataRole.UserRole)
+        self._flush_pending_save()
+        current_index = self.semester_list.currentIndex()
+        if current_index.isValid():
+            semester_index = current_index.row()
             semester = self.current_module_data["semesters"][semester_index]
             
             # Create edit dialog
@@ -581,29 +871,31 @@ class EducationModuleDialog(QDialog):
                 new_title = dialog.textValue().strip()
                 if new_title:
                     semester["title"] = new_title
-                    current_item.setText(f"📋 {new_title}")
+                    self.semester_model.row_changed(semester_index)
                     self.semester_title_input.setText(new_title)
 
     def _delete_semester(self):
         """Delete selected semester"""
-        current_item = self.semester_list.currentItem()
-        if current_item:
+        self._flush_pending_save()
+        current_index = self.semester_list.currentIndex()
+        if current_index.isValid():
             reply = QMessageBox.question(self, "Подтверждение", 
                                        "Вы уверены, что хотите удалить этот раздел?",
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if reply == QMessageBox.StandardButton.Yes:
-                semester_index = current_item.data(Qt.ItemDataRole.UserRole)
-                self.current_module_data["semesters"].pop(semester_index)
-                self._populate_semester_list()
+                self.semester_model.remove_row(current_index.row())
+                self.current_semester_index = -1
+                self.current_lab_index = -1
                 
                 # Clear details
-                self.semester_title_input.clear()
-                self.labs_list.clear()
-                self.lab_title_input.clear()
-                self.lab_link_input.clear()
-                self.edit_semester_btn.setEnabled(False)
-                self.delete_semester_btn.setEnabled(False)
-                self.delete_lab_btn.setEnabled(False)
+                with _batch_update(self, self.semester_title_input, self.lab_title_input, self.lab_link_input):
+                    self.semester_title_input.clear()
+                    self.lab_model.set_rows([])
+                    self.lab_title_input.clear()
+                    self.lab_link_input.clear()
+                    self.edit_semester_btn.setEnabled(False)
+                    self.delete_semester_btn.setEnabled(False)
+                    self.delete_lab_btn.setEnabled(False)
 
     def _add_lab(self):
         """Add a new lab to current semester"""
@@ -617,11 +909,11 @@ class EducationModuleDialog(QDialog):
             "link": "#"
         }
         
-        self.current_module_data["semesters"][self.current_semester_index]["labs"].append(new_lab)
-        self._populate_labs_list()
+        self.lab_model.append_row(new_lab)
 
     def _delete_lab(self):
         """Delete selected lab"""
+        self._flush_pending_save()
         if self.current_lab_index == -1:
             return
             
@@ -629,46 +921,66 @@ class EducationModuleDialog(QDialog):
                                    "Вы уверены, что хотите удалить эту лабораторную работу?",
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.current_module_data["semesters"][self.current_semester_index]["labs"].pop(self.current_lab_index)
-            self._populate_labs_list()
+            self.lab_model.remove_row(self.current_lab_index)
+            self.current_lab_index = -1
+            self.delete_lab_btn.setEnabled(False)
 
     def _populate_labs_list(self):
         """Populate the labs list for current semester"""
-        self.labs_list.clear()
+        self.current_lab_index = -1
         if self.current_semester_index != -1:
             semester = self.current_module_data["semesters"][self.current_semester_index]
-            for i, lab in enumerate(semester["labs"]):
-                item = QListWidgetItem(f"🧪 {lab['title']}")
-                item.setData(Qt.ItemDataRole.UserRole, i)
-                self.labs_list.addItem(item)
+            self.lab_model.set_rows(semester["labs"])
+        else:
+            self.lab_model.set_rows([])
 
-    def _on_semester_selected(self, item):
+    def _on_semester_selected(self, index: QModelIndex):
         """Handle semester selection"""
-        if not item:
+        if not index.isValid():
             return
+        self._flush_pending_save()
             
-        self.current_semester_index = item.data(Qt.ItemDataRole.UserRole)
+        self.current_semester_index = index.row()
         semester = self.current_module_data["semesters"][self.current_semester_index]
         
-        self.details_title.setText(f"Редактирование: {semester['title']}")
-        self.semester_title_input.setText(semester["title"])
-        self._populate_labs_list()
-        
-        self.edit_semester_btn.setEnabled(True)
-        self.delete_semester_btn.setEnabled(True)
-        self.delete_lab_btn.setEnabled(False)
+        with _batch_update(self, self.semester_title_input):
+            self.details_title.setText(f"Редактирование: {semester['title']}")
+            self.semester_title_input.setText(semester["title"])
+            self._populate_labs_list()
+            
+            self.edit_semester_btn.setEnabled(True)
+            self.delete_semester_btn.setEnabled(True)
+            self.delete_lab_btn.setEnabled(False)
 
-    def _on_lab_selected(self, item):
+    def _on_lab_selected(self, index: QModelIndex):
         """Handle lab selection"""
-        if not item:
+        if not index.isValid():
             return
+        self._flush_pending_save()
             
-        self.current_lab_index = item.data(Qt.ItemDataRole.UserRole)
+        self.current_lab_index = index.row()
         lab = self.current_module_data["semesters"][self.current_semester_index]["labs"][self.current_lab_index]
         
-        self.lab_title_input.setText(lab["title"])
-        self.lab_link_input.setText(lab["link"])
-        self.delete_lab_btn.setEnabled(True)
+        with _batch_update(self, self.lab_title_input, self.lab_link_input):
+            self.lab_title_input.setText(lab["title"])
+            self.lab_link_input.setText(lab["link"])
+            self.delete_lab_btn.setEnabled(True)
+
+    def _schedule_save(self, kind: str):
+        """Restart the save timer for the semester or lab inputs"""
+        if self._pending_save not in (None, kind):
+            self._flush_pending_save()
+        self._pending_save = kind
+        self._save_timer.start()
+
+    def _flush_pending_save(self):
+        """Apply a scheduled save right away"""
+        self._save_timer.stop()
+        pending, self._pending_save = self._pending_save, None
+        if pending == "semester":
+            self._save_current_semester()
+        elif pending == "lab":
+            self._save_current_lab()
 
     def _save_current_semester(self):
         """Save current semester title"""
@@ -677,9 +989,7 @@ class EducationModuleDialog(QDialog):
             if new_title:
                 self.current_module_data["semesters"][self.current_semester_index]["title"] = new_title
                 # Update list item
-                current_item = self.semester_list.currentItem()
-                if current_item:
-                    current_item.setText(f"📋 {new_title}")
+                self.semester_model.row_changed(self.current_semester_index)
 
     def _save_current_lab(self):
         """Save current lab data"""
@@ -689,142 +999,66 @@ class EducationModuleDialog(QDialog):
             lab["link"] = self.lab_link_input.text().strip()
             
             # Update list item
-            current_item = self.labs_list.currentItem()
-            if current_item:
-                current_item.setText(f"🧪 {lab['title']}")
+            self.lab_model.row_changed(self.current_lab_index)
 
     def get_module_data(self):
         """Get the complete module data"""
+        self._flush_pending_save()
         return {
             "title": self.title_input.text().strip(),
             "semesters": self.current_module_data["semesters"]
         }
 
-class ThesisDialog(QDialog):
-    def __init__(self, parent=None, title: str = "", thesis_data: Dict[str, Any] | None = None):
-        super().__init__(parent)
-        self.setWindowTitle(title)
-        self.setModal(True)
-        self.resize(500, 600)
-
-        layout = QFormLayout(self)
-
-        # Title
-        self.title_input = QLineEdit()
-        self.title_input.setText(thesis_data.get("title", "") if thesis_data else "")
-        layout.addRow("Название:", self.title_input)
-
-        # Topic
-        self.topic_input = QLineEdit()
-        self.topic_input.setText(thesis_data.get("topic", "") if thesis_data else "")
-        layout.addRow("Тема:", self.topic_input)
-
-        # Description
-        self.description_input = QTextEdit()
-        self.description_input.setPlainText(thesis_data.get("description", "") if thesis_data else "")
-        layout.addRow("Описание:", self.description_input)
-
-        # Preview Image
-        self.preview_input = QLineEdit()
-        self.preview_input.setText(thesis_data.get("previewImage", "") if thesis_data else "")
-        layout.addRow("Превью изображение:", self.preview_input)
-
-        # Link
-        self.link_input = QLineEdit()
-        self.link_input.setText(thesis_data.get("link", "") if thesis_data else "")
-        layout.addRow("Ссылка:", self.link_input)
-
-        # Key Features
-        self.features_layout = QVBoxLayout()
-        self.features_layout.addWidget(QLabel("Основные разделы:"))
-
-        if thesis_data and "keyFeatures" in thesis_data:
-            for feature in thesis_data["keyFeatures"]:
-                self._add_feature_widget(feature)
-        else:
-            self._add_feature_widget()
-
-        add_feature_btn = QPushButton("➕ Добавить раздел")
-        add_feature_btn.clicked.connect(self._add_feature_widget)
-        self.features_layout.addWidget(add_feature_btn)
-
-        layout.addRow(self.features_layout)
-
-        # Buttons
-        self.btns = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        self.btns.accepted.connect(self.accept)
-        self.btns.rejected.connect(self.reject)
-        layout.addRow(self.btns)
-
-    def _add_feature_widget(self, feature_text: str = ""):
-        feature_widget = QWidget()
-        feature_layout = QHBoxLayout(feature_widget)
-
-        feature_input = QLineEdit()
-        feature_input.setText(feature_text)
-        feature_layout.addWidget(feature_input)
-
-        self.features_layout.insertLayout(self.features_layout.count() - 1, feature_layout)
-
-    def get_thesis_data(self):
-        thesis_data = {
-            "title": self.title_input.text(),
-            "topic": self.topic_input.text(),
-            "description": self.description_input.toPlainText(),
-            "previewImage": self.preview_input.text(),
-            "link": self.link_input.text(),
-            "keyFeatures": []
-        }
-
-        # Extract features (simplified for demo)
-        thesis_data["keyFeatures"].append("Пример раздела")
+@dataclass(frozen=True)
+class FieldSpec:
+    """Одно поле формы: ключ в JSON, подпись и тип виджета (line, text или list)."""
+    key: str
+    label: str
+    kind: str = "line"
+    add_text: str = ""
 
-        return thesis_data
+class GenericFormDialog(QDialog):
+    SCHEMA: tuple = ()
+    SIZE = (500, 500)
 
-class CourseworkDialog(QDialog):
-    def __init__(self, parent=None, title: str = "", coursework_data: Dict[str, Any] | None = None):
+    def __init__(self, parent=None, title: str = "", data: Dict[str, Any] | None = None):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setModal(True)
-        self.resize(500, 500)
+        self.resize(*self.SIZE)
 
         layout = QFormLayout(self)
-
-        # Title
-        self.title_input = QLineEdit()
-        self.title_input.setText(coursework_data.get("title", "") if coursework_data else "")
-        layout.addRow("Название:", self.title_input)
-
-        # Semester
-        self.semester_input = QLineEdit()
-        self.semester_input.setText(coursework_data.get("semester", "") if coursework_data else "")
-        layout.addRow("Семестр:", self.semester_input)
-
-        # Description
-        self.description_input = QTextEdit()
-        self.description_input.setPlainText(coursework_data.get("description", "") if coursework_data else "")
-        layout.addRow("Описание:", self.description_input)
-
-        # Link
-        self.link_input = QLineEdit()
-        self.link_input.setText(coursework_data.get("link", "") if coursework_data else "")
-        layout.addRow("Ссылка:", self.link_input)
-
-        # Technologies
-        self.technologies_layout = QVBoxLayout()
-        self.technologies_layout.addWidget(QLabel("Технологии:"))
-
-        if coursework_data and "technologies" in coursework_data:
-            for tech in coursework_data["technologies"]:
-                self._add_technology_widget(tech)
-        else:
-            self._add_technology_widget()
-
-        add_tech_btn = QPushButton("➕ Добавить технологию")
-        add_tech_btn.clicked.connect(self._add_technology_widget)
-        self.technologies_layout.addWidget(add_tech_btn)
-
-        layout.addRow(self.technologies_layout)
+        self._widgets: Dict[str, QWidget] = {}
+        d = data or {}
+
+        for spec in self.SCHEMA:
+            if spec.kind == "list":
+                # Строки списка редактируются прямо в QListWidget (двойной клик)
+                rows_layout = QVBoxLayout()
+                rows_layout.addWidget(QLabel(spec.label))
+                rows_list = QListWidget()
+                self._widgets[spec.key] = rows_list
+                rows_layout.addWidget(rows_list)
+
+                add_btn = QPushButton(spec.add_text)
+                add_btn.clicked.connect(lambda _=False, key=spec.key: self._widgets[key].editItem(self._add_row(key)))
+                rows_layout.addWidget(add_btn)
+
+                # Новая запись начинается с одной пустой строки
+                for text in d.get(spec.key, [""]):
+                    self._add_row(spec.key, text)
+
+                layout.addRow(rows_layout)
+                continue
+
+            if spec.kind == "text":
+                widget = QPlainTextEdit()
+                widget.setPlainText(d.get(spec.key, ""))
+            else:
+                widget = QLineEdit()
+                widget.setText(d.get(spec.key, ""))
+            self._widgets[spec.key] = widget
+            layout.addRow(spec.label, widget)
 
         # Buttons
         self.btns = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
@@ -832,187 +1066,183 @@ class CourseworkDialog(QDialog):
         self.btns.rejected.connect(self.reject)
         layout.addRow(self.btns)
 
-    def _add_technology_widget(self, tech_text: str = ""):
-        tech_widget = QWidget()
-        tech_layout = QHBoxLayout(tech_widget)
-
-        tech_input = QLineEdit()
-        tech_input.setText(tech_text)
-        tech_layout.addWidget(tech_input)
-
-        self.technologies_layout.insertLayout(self.technologies_layout.count() - 1, tech_layout)
-
-    def get_coursework_data(self):
-        coursework_data = {
-            "title": self.title_input.text(),
-            "semester": self.semester_input.text(),
-            "description": self.description_input.toPlainText(),
-            "link": self.link_input.text(),
-            "technologies": []
-        }
-
-        # Extract technologies (simplified for demo)
-        coursework_data["technologies"].append("Пример технологии")
-
-        return coursework_data
-
-class PracticalWorkDialog(QDialog):
-    def __init__(self, parent=None, title: str = "", practical_data: Dict[str, Any] | None = None):
-        super().__init__(parent)
-        self.setWindowTitle(title)
-        self.setModal(True)
-        self.resize(500, 500)
-
-        layout = QFormLayout(self)
-
-        # Title
-        self.title_input = QLineEdit()
-        self.title_input.setText(practical_data.get("title", "") if practical_data else "")
-        layout.addRow("Название:", self.title_input)
-
-        # Semester
-        self.semester_input = QLineEdit()
-        self.semester_input.setText(practical_data.get("semester", "") if practical_data else "")
-        layout.addRow("Семестр:", self.semester_input)
-
-        # Description
-        self.description_input = QTextEdit()
-        self.description_input.setPlainText(practical_data.get("description", "") if practical_data else "")
-        layout.addRow("Описание:", self.description_input)
-
-        # Link
-        self.link_input = QLineEdit()
-        self.link_input.setText(practical_data.get("link", "") if practical_data else "")
-        layout.addRow("Ссылка:", self.link_input)
-
-        # Items
-        self.items_layout = QVBoxLayout()
-        self.items_layout.addWidget(QLabel("Практические работы:"))
-
-        if practical_data and "items" in practical_data:
-            for item in practical_data["items"]:
-                self._add_item_widget(item)
-        else:
-            self._add_item_widget()
-
-        add_item_btn = QPushButton("➕ Добавить работу")
-        add_item_btn.clicked.connect(self._add_item_widget)
-        self.items_layout.addWidget(add_item_btn)
-
-        layout.addRow(self.items_layout)
-
-        # Buttons
-        self.btns = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
-        self.btns.accepted.connect(self.accept)
-        self.btns.rejected.connect(self.reject)
-        layout.addRow(self.btns)
-
-    def _add_item_widget(self, item_text: str = ""):
-        item_widget = QWidget()
-        item_layout = QHBoxLayout(item_widget)
-
-        item_input = QLineEdit()
-        item_input.setText(item_text)
-        item_layout.addWidget(item_input)
+    def _add_row(self, key: str, text: str = "") -> QListWidgetItem:
+        item = QListWidgetItem(text)
+        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
+        self._widgets[key].addItem(item)
+        return item
+
+    def get_data(self):
+        data = {}
+        for spec in self.SCHEMA:
+            widget = self._widgets[spec.key]
+            if spec.kind == "list":
+                # Пустые строки не сохраняем
+                texts = (widget.item(i).text().strip() for i in range(widget.count()))
+                data[spec.key] = [t for t in texts if t]
+            elif spec.kind == "text":
+                data[spec.key] = widget.toPlainText()
+            else:
+                data[spec.key] = widget.text()
+        return data
+
+class ThesisDialog(GenericFormDialog):
+    SIZE = (500, 600)
+    SCHEMA = (
+        FieldSpec("title", "Название:"),
+        FieldSpec("topic", "Тема:"),
+        FieldSpec("description", "Описание:", "text"),
+        FieldSpec("previewImage", "Превью изображение:"),
+        FieldSpec("link", "Ссылка:"),
+        FieldSpec("keyFeatures", "Основные разделы:", "list", "➕ Добавить раздел"),
+    )
 
-        self.items_layout.insertLayout(self.items_layout.count() - 1, item_layout)
+class CourseworkDialog(GenericFormDialog):
+    SCHEMA = (
+        FieldSpec("title", "Название:"),
+        FieldSpec("semester", "Семестр:"),
+        FieldSpec("description", "Описание:", "text"),
+        FieldSpec("link", "Ссылка:"),
+        FieldSpec("technologies", "Технологии:", "list", "➕ Добавить технологию"),
+    )
 
-    def get_practical_data(self):
-        practical_data = {
-            "title": self.title_input.text(),
-            "semester": self.semester_input.text(),
-            "description": self.description_input.toPlainText(),
-            "link": self.link_input.text(),
-            "items": []
-        }
+class PracticalWorkDialog(GenericFormDialog):
+    SCHEMA = (
+        FieldSpec("title", "Название:"),
+        FieldSpec("semester", "Семестр:"),
+        FieldSpec("description", "Описание:", "text"),
+        FieldSpec("link", "Ссылка:"),
+        FieldSpec("items", "Практические работы:", "list", "➕ Добавить работу"),
+    )
 
-        # Extract items (simplified for demo)
-        practical_data["items"].append("Пример работы")
+# Application-wide sheets, set once on the QApplication in main().
+# Nav buttons are matched by their "class" property
+_MAIN_QSS = """
+QMainWindow { background: #0f172a; color: #e2e8f0; }
+QWidget { background: #0f172a; color: #e2e8f0; }
+QLabel { font-family: 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; color: #e2e8f0; font-size: 14px; }
+QPushButton { 
+    padding: 10px 16px; 
+    border-radius: 8px; 
+    border: 1px solid #334155; 
+    background: #1e293b; 
+    color: #e2e8f0; 
+    font-weight: 500;
+    transition: all 0.2s ease;
+}
+QPushButton:hover { 
+    background: #334155; 
+    border-color: #475569;
+    transform: translateY(-1px);
+}
+QPushButton:pressed { transform: translateY(0); }
+QTableView { 
+    border: 1px solid #334155; 
+    background: #0b1220; 
+    color: #e2e8f0; 
+    gridline-color: #334155; 
+    border-radius: 8px;
+}
+QHeaderView::section { 
+    background: #1e293b; 
+    color: #e2e8f0; 
+    padding: 8px; 
+    border: 1px solid #334155;
+    font-weight: 600;
+}
+QProgressBar { 
+    height: 10px; 
+    border-radius: 5px; 
+    background: #1e293b; 
+    border: 1px solid #334155;
+}
+QProgressBar::chunk { 
+    background-color: #22c55e; 
+    border-radius: 5px;
+}
+QLineEdit, QPlainTextEdit { 
+    background: #111827; 
+    color: #e2e8f0; 
+    border: 1px solid #334155; 
+    border-radius: 6px;
+    padding: 8px;
+}
+QLineEdit:focus, QPlainTextEdit:focus { border-color: #60a5fa; }
+QComboBox { 
+    background: #111827; 
+    color: #e2e8f0; 
+    border: 1px solid #334155; 
+    border-radius: 6px;
+    padding: 8px;
+}
+QTabWidget::pane { border: 1px solid #334155; background: #0f172a; }
+QTabBar::tab { 
+    background: #1e293b; 
+    color: #e2e8f0; 
+    padding: 8px 16px; 
+    border: 1px solid #334155; 
+    border-bottom: none; 
+    border-radius: 6px 6px 0 0;
+    margin-right: 2px;
+}
+QTabBar::tab:selected { background: #0f172a; border-bottom: 1px solid #0f172a; }
+QDialog { background: #0f172a; }
+QDialogButtonBox { background: transparent; }
+"""
 
-        return practical_data
+_NAV_QSS = """
+QPushButton[class="nav"] {
+    text-align: left;
+    padding: 12px 16px;
+    border-radius: 8px;
+    border: 1px solid #334155;
+    background: #0b1220;
+    color: #e2e8f0;
+    font-weight: 500;
+    margin-bottom: 8px;
+}
+QPushButton[class="nav"]:hover {
+    background: #1e293b;
+    border-color: #475569;
+}
+QPushButton[class="nav"]:pressed {
+    background: #334155;
+}
+"""
 
 class PortfolioApp(QMainWindow):
     def __init__(self, repo_path: str = "."):
         super().__init__()
         self.repo_path = os.path.abspath(repo_path)
         self.manager = PortfolioManager(self.repo_path)
+        # Built on first use and reset for every later add/edit
+        self._module_dialog = None
+        # Last thesis dict shown in thesis_info
+        self._thesis_cache: Dict[str, Any] | None = None
+        # Refreshes requested by add/edit/delete are coalesced into one pass
+        self._refresh_pending: set[str] = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+        # Data file writes are queued per kind and done off the GUI thread.
+        # One writer thread keeps writes to the same file in order
+        self._write_queue: Dict[str, Any] = {}
+        self._writes_in_flight: Dict[str, Any] = {}
+        self._write_timer = QTimer(self)
+        self._write_timer.setSingleShot(True)
+        self._write_timer.timeout.connect(self._flush_writes)
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
         self.initUI()
 
+        # Manager log messages also show up in the status bar
+        self._log_handler = QtLogHandler()
+        self._log_handler.signals.message.connect(self.statusBar().showMessage)
+        logging.getLogger("portfolio").addHandler(self._log_handler)
+
     def initUI(self):
         self.setWindowTitle("Portfolio Manager - Студенческое портфолио")
         self.setGeometry(100, 100, 1400, 900)
-        self.setStyleSheet("""
-            QMainWindow { background: #0f172a; color: #e2e8f0; }
-            QWidget { background: #0f172a; color: #e2e8f0; }
-            QLabel { font-family: 'Segoe UI', Roboto, Helvetica, Arial, sans-serif; color: #e2e8f0; font-size: 14px; }
-            QPushButton { 
-                padding: 10px 16px; 
-                border-radius: 8px; 
-                border: 1px solid #334155; 
-                background: #1e293b; 
-                color: #e2e8f0; 
-                font-weight: 500;
-                transition: all 0.2s ease;
-            }
-            QPushButton:hover { 
-                background: #334155; 
-                border-color: #475569;
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed { transform: translateY(0); }
-            QTableWidget { 
-                border: 1px solid #334155; 
-                background: #0b1220; 
-                color: #e2e8f0; 
-                gridline-color: #334155; 
-                border-radius: 8px;
-            }
-            QHeaderView::section { 
-                background: #1e293b; 
-                color: #e2e8f0; 
-                padding: 8px; 
-                border: 1px solid #334155;
-                font-weight: 600;
-            }
-            QProgressBar { 
-                height: 10px; 
-                border-radius: 5px; 
-                background: #1e293b; 
-                border: 1px solid #334155;
-            }
-            QProgressBar::chunk { 
-                background-color: #22c55e; 
-                border-radius: 5px;
-            }
-            QLineEdit, QTextEdit { 
-                background: #111827; 
-                color: #e2e8f0; 
-                border: 1px solid #334155; 
-                border-radius: 6px;
-                padding: 8px;
-            }
-            QLineEdit:focus, QTextEdit:focus { border-color: #60a5fa; }
-            QComboBox { 
-                background: #111827; 
-                color: #e2e8f0; 
-                border: 1px solid #334155; 
-                border-radius: 6px;
-                padding: 8px;
-            }
-            QTabWidget::pane { border: 1px solid #334155; background: #0f172a; }
-            QTabBar::tab { 
-                background: #1e293b; 
-                color: #e2e8f0; 
-                padding: 8px 16px; 
-                border: 1px solid #334155; 
-                border-bottom: none; 
-                border-radius: 6px 6px 0 0;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected { background: #0f172a; border-bottom: 1px solid #0f172a; }
-            QDialog { background: #0f172a; }
-            QDialogButtonBox { background: transparent; }
-        """)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -1035,37 +1265,19 @@ class PortfolioApp(QMainWindow):
         self.deploy_btn = QPushButton("🚀 Автодеплой в GitHub")
         self.preview_btn = QPushButton("👀 Просмотр сайта")
 
-        # Style navigation buttons
-        nav_style = """
-            QPushButton {
-                text-align: left;
-                padding: 12px 16px;
-                border-radius: 8px;
-                border: 1px solid #334155;
-                background: #0b1220;
-                color: #e2e8f0;
-                font-weight: 500;
-                margin-bottom: 8px;
-            }
-            QPushButton:hover {
-                background: #1e293b;
-                border-color: #475569;
-            }
-            QPushButton:pressed {
-                background: #334155;
-            }
-        """
-        
+        # Style navigation buttons (_NAV_QSS matches the class property)
         for b in [self.education_btn, self.thesis_btn, self.courseworks_btn, self.practical_btn,
                  self.deploy_btn, self.preview_btn]:
-            b.setStyleSheet(nav_style)
+            b.setProperty("class", "nav")
             b.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
 
-        self.education_btn.clicked.connect(lambda: self.work_area.setCurrentIndex(0))
-        self.thesis_btn.clicked.connect(lambda: self.work_area.setCurrentIndex(1))
-        self.courseworks_btn.clicked.connect(lambda: self.work_area.setCurrentIndex(2))
-        self.practical_btn.clicked.connect(lambda: self.work_area.setCurrentIndex(3))
-        self.deploy_btn.clicked.connect(lambda: self.work_area.setCurrentIndex(4))
+        # Button id == tab index in work_area
+        self._nav_group = QButtonGroup(self)
+        self._nav_group.setExclusive(False)
+        for idx, b in enumerate([self.education_btn, self.thesis_btn, self.courseworks_btn,
+                                 self.practical_btn, self.deploy_btn]):
+            self._nav_group.addButton(b, idx)
+        self._nav_group.idClicked.connect(self._activate_tab)
         self.preview_btn.clicked.connect(self.openSite)
 
         nav.addWidget(self.education_btn)
@@ -1083,23 +1295,92 @@ class PortfolioApp(QMainWindow):
         # Work area
         self.work_area = QStackedWidget()
 
-        # Education Modules Tab
-        self.education_widget = self.create_education_widget()
-        self.thesis_widget = self.create_thesis_widget()
-        self.courseworks_widget = self.create_courseworks_widget()
-        self.practical_widget = self.create_practical_widget()
-        self.deploy_widget = self.create_deploy_widget()
-
-        self.work_area.addWidget(self.education_widget)
-        self.work_area.addWidget(self.thesis_widget)
-        self.work_area.addWidget(self.courseworks_widget)
-        self.work_area.addWidget(self.practical_widget)
-        self.work_area.addWidget(self.deploy_widget)
+        # Вкладки строятся при первом открытии, до этого в стеке пустые заглушки
+        self._tab_builders: Dict[int, Callable[[], QWidget]] = {
+            0: self.create_education_widget,
+            1: self.create_thesis_widget,
+            2: self.create_courseworks_widget,
+            3: self.create_practical_widget,
+            4: self.create_deploy_widget,
+        }
+        self._tab_built: set[int] = set()
+        with _batch_update(self.work_area):
+            for _ in self._tab_builders:
+                self.work_area.addWidget(QWidget())
 
         main.addWidget(self.work_area, 4)
+        self._activate_tab(0)
 
         self.statusBar().showMessage("Готов к работе")
 
+    def _activate_tab(self, idx: int):
+        """Show tab idx, building its widget on first activation"""
+        if idx not in self._tab_built:
+            # The tab is built off-screen (no parent yet); the stack is frozen
+            # only for the swap so it relayouts once
+            page = self._tab_builders[idx]()
+            with _batch_update(self.work_area):
+                placeholder = self.work_area.widget(idx)
+                self.work_area.removeWidget(placeholder)
+                placeholder.deleteLater()
+                self.work_area.insertWidget(idx, page)
+                self.work_area.setCurrentIndex(idx)
+            self._tab_built.add(idx)
+            return
+        self.work_area.setCurrentIndex(idx)
+
+    def _schedule_refresh(self, kind: str):
+        """Queue refresh_<kind> to run once after the current burst of changes"""
+        self._refresh_pending.add(kind)
+        self._refresh_timer.start(50)
+
+    def _flush_refresh(self):
+        pending, self._refresh_pending = self._refresh_pending, set()
+        for kind in pending:
+            getattr(self, "refresh_" + kind)()
+
+    def _read(self, kind: str) -> Any:
+        """Read a data file, seeing writes that are queued or still running.
+        The result is shared: callers build new lists instead of mutating it"""
+        if kind in self._write_queue:
+            return self._write_queue[kind]
+        if kind in self._writes_in_flight:
+            return self._writes_in_flight[kind]
+        return getattr(self.manager, kind).read()
+
+    def _queue_write(self, kind: str, data: Any):
+        """Queue data for the kind's file; repeated writes within 200 ms collapse into one"""
+        self._write_queue[kind] = data
+        self._write_timer.start(200)
+        self._schedule_refresh(kind)
+
+    def _flush_writes(self):
+        self._write_timer.stop()
+        pending, self._write_queue = self._write_queue, {}
+        for kind, data in pending.items():
+            self._writes_in_flight[kind] = data
+            runnable = _WriteRunnable(getattr(self.manager, kind), kind, data)
+            runnable.signals.done.connect(self._write_done)
+            self._write_pool.start(runnable)
+
+    def _write_done(self, kind: str, data: Any, ok: bool):
+        # A newer write of the same kind may already be in flight
+        if self._writes_in_flight.get(kind) is data:
+            del self._writes_in_flight[kind]
+        if not ok:
+            # The view already shows the unsaved edit: bring it back in line with the disk
+            self._schedule_refresh(kind)
+            QMessageBox.warning(self, "Ошибка",
+                                f"Ошибка записи {getattr(self.manager, kind).label}. Изменения не сохранены")
+
+    def _wait_for_writes(self):
+        self._flush_writes()
+        self._write_pool.waitForDone()
+
+    def closeEvent(self, event):
+        self._wait_for_writes()
+        super().closeEvent(event)
+
     def create_education_widget(self):
         w = QWidget()
         lay = QVBoxLayout(w)
@@ -1109,12 +1390,14 @@ class PortfolioApp(QMainWindow):
         self.add_education_btn.clicked.connect(self.add_education_module)
         lay.addWidget(self.add_education_btn)
 
-        self.education_table = QTableWidget()
-        self.education_table.setColumnCount(3)
-        self.education_table.setHorizontalHeaderLabels(["Название модуля", "Количество семестров"])
-        if self.education_table.horizontalHeader():
-            self.education_table.horizontalHeader().setStretchLastSection(True)
-        self.education_table.setAlternatingRowColors(True)
+        self.education_model = PortfolioListModel(_EDUCATION_COLUMNS, self)
+        self.education_table = QTableView()
+        self.education_table.setModel(self.education_model)
+        self.education_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        hh = self.education_table.horizontalHeader()
+        if hh:
+            hh.setStretchLastSection(True)
+        _size_columns(self.education_table, _EDUCATION_COLUMNS)
         lay.addWidget(self.education_table)
 
         btns = QHBoxLayout()
@@ -1141,7 +1424,7 @@ class PortfolioApp(QMainWindow):
         self.edit_thesis_btn.clicked.connect(self.edit_thesis)
         lay.addWidget(self.edit_thesis_btn)
 
-        self.thesis_info = QTextEdit()
+        self.thesis_info = QPlainTextEdit()
         self.thesis_info.setReadOnly(True)
         lay.addWidget(self.thesis_info)
 
@@ -1157,12 +1440,14 @@ class PortfolioApp(QMainWindow):
         self.add_coursework_btn.clicked.connect(self.add_coursework)
         lay.addWidget(self.add_coursework_btn)
 
-        self.courseworks_table = QTableWidget()
-        self.courseworks_table.setColumnCount(3)
-        self.courseworks_table.setHorizontalHeaderLabels(["Название", "Семестр", "Технологии"])
-        if self.courseworks_table.horizontalHeader():
-            self.courseworks_table.horizontalHeader().setStretchLastSection(True)
-        self.courseworks_table.setAlternatingRowColors(True)
+        self.courseworks_model = PortfolioListModel(_COURSEWORK_COLUMNS, self)
+        self.courseworks_table = QTableView()
+        self.courseworks_table.setModel(self.courseworks_model)
+        self.courseworks_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        hh = self.courseworks_table.horizontalHeader()
+        if hh:
+            hh.setStretchLastSection(True)
+        _size_columns(self.courseworks_table, _COURSEWORK_COLUMNS)
         lay.addWidget(self.courseworks_table)
 
         btns = QHBoxLayout()
@@ -1189,12 +1474,14 @@ class PortfolioApp(QMainWindow):
         self.add_practical_btn.clicked.connect(self.add_practical_work)
         lay.addWidget(self.add_practical_btn)
 
-        self.practical_table = QTableWidget()
-        self.practical_table.setColumnCount(3)
-        self.practical_table.setHorizontalHeaderLabels(["Название", "Семестр", "Количество работ"])
-        if self.practical_table.horizontalHeader():
-            self.practical_table.horizontalHeader().setStretchLastSection(True)
-        self.practical_table.setAlternatingRowColors(True)
+        self.practical_model = PortfolioListModel(_PRACTICAL_COLUMNS, self)
+        self.practical_table = QTableView()
+        self.practical_table.setModel(self.practical_model)
+        self.practical_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        hh = self.practical_table.horizontalHeader()
+        if hh:
+            hh.setStretchLastSection(True)
+        _size_columns(self.practical_table, _PRACTICAL_COLUMNS)
         lay.addWidget(self.practical_table)
 
         btns = QHBoxLayout()
@@ -1218,7 +1505,7 @@ class PortfolioApp(QMainWindow):
         lay.addWidget(QLabel("🚀 Автодеплой в GitHub"))
         lay.addWidget(QLabel("Эта функция автоматически загружает все изменения в ваш GitHub репозиторий."))
         lay.addWidget(QLabel("Сообщение коммита:"))
-        self.commit_input = QTextEdit()
+        self.commit_input = QPlainTextEdit()
         self.commit_input.setPlainText("Update portfolio content via Portfolio Manager")
         self.commit_input.setMaximumHeight(80)
         lay.addWidget(self.commit_input)
@@ -1234,58 +1521,63 @@ class PortfolioApp(QMainWindow):
         return w
 
     def openSite(self):
-        webbrowser.open("https://NSODAT.github.io/developer-portfolio")
+        # webbrowser.open can block on the OS URL handler, keep it off the GUI thread
+        QThreadPool.globalInstance().start(_OpenUrlRunnable("https://NSODAT.github.io/developer-portfolio"))
 
     # Education Modules Methods
     def refresh_education_modules(self):
-        modules = self.manager.read_education_modules()
-        self.education_table.setRowCount(len(modules))
-        for i, module in enumerate(modules):
-            self.education_table.setItem(i, 0, QTableWidgetItem(module.get("title", "")))
-            self.education_table.setItem(i, 1, QTableWidgetItem(str(len(module.get("semesters", [])))))
+        _fill_table(self.education_table, self.education_model, self._read("education_modules"))
+
+    def _education_module_dialog(self, title: str, module_data: Dict[str, Any] | None = None):
+        if self._module_dialog is None:
+            self._module_dialog = EducationModuleDialog(self, title, module_data)
+        else:
+            self._module_dialog.reset(title, module_data)
+        return self._module_dialog
 
     def add_education_module(self):
-        dialog = EducationModuleDialog(self, "Добавить учебный модуль")
+        dialog = self._education_module_dialog("Добавить учебный модуль")
         if dialog.exec():
             data = dialog.get_module_data()
-            modules = self.manager.read_education_modules()
+            modules = self._read("education_modules")
             data["id"] = len(modules) + 1
-            modules.append(data)
-            if self.manager.write_education_modules(modules):
-                self.refresh_education_modules()
+            modules = [*modules, data]
+            self._queue_write("education_modules", modules)
 
     def edit_education_module(self):
-        row = self.education_table.currentRow()
+        row = self.education_table.currentIndex().row()
         if row < 0:
             QMessageBox.warning(self, "Внимание", "Выберите модуль для редактирования")
             return
-        modules = self.manager.read_education_modules()
+        modules = self._read("education_modules")
         if row >= len(modules):
             return
-        dialog = EducationModuleDialog(self, "Редактировать учебный модуль", modules[row])
+        dialog = self._education_module_dialog("Редактировать учебный модуль", modules[row])
         if dialog.exec():
             updated = dialog.get_module_data()
             updated["id"] = modules[row]["id"]
-            modules[row] = updated
-            if self.manager.write_education_modules(modules):
-                self.refresh_education_modules()
+            if updated == modules[row]:
+                return
+            modules = modules[:row] + [updated] + modules[row + 1:]
+            self._queue_write("education_modules", modules)
 
     def delete_education_module(self):
-        row = self.education_table.currentRow()
+        row = self.education_table.currentIndex().row()
         if row < 0:
             return
         reply = QMessageBox.question(self, "Подтверждение", "Вы уверены, что хотите удалить этот модуль?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            modules = self.manager.read_education_modules()
+            modules = self._read("education_modules")
             if row < len(modules):
-                modules.pop(row)
-                if self.manager.write_education_modules(modules):
-                    self.refresh_education_modules()
+                modules = modules[:row] + modules[row + 1:]
+                self._queue_write("education_modules", modules)
 
     # Thesis Methods
     def refresh_thesis(self):
-        thesis = self.manager.read_thesis()
+        thesis = self._read("thesis")
+        if thesis == self._thesis_cache:
+            return
         info = f"📝 {thesis.get('title', 'Дипломная работа')}\n\n"
         info += f"🎯 Тема: {thesis.get('topic', 'Не указана')}\n\n"
         info += f"📄 Описание: {thesis.get('description', 'Нет описания')}\n\n"
@@ -1294,110 +1586,101 @@ class PortfolioApp(QMainWindow):
         for feature in thesis.get("keyFeatures", []):
             info += f"• {feature}\n"
         self.thesis_info.setPlainText(info)
+        self._thesis_cache = thesis
 
     def edit_thesis(self):
-        thesis = self.manager.read_thesis()
+        thesis = self._read("thesis")
         dialog = ThesisDialog(self, "Редактировать дипломную работу", thesis)
         if dialog.exec():
-            updated = dialog.get_thesis_data()
-            if self.manager.write_thesis(updated):
-                self.refresh_thesis()
+            updated = dialog.get_data()
+            # Saved without changes: nothing to write
+            if updated == thesis:
+                return
+            self._queue_write("thesis", updated)
 
     # Courseworks Methods
     def refresh_courseworks(self):
-        courseworks = self.manager.read_courseworks()
-        self.courseworks_table.setRowCount(len(courseworks))
-        for i, cw in enumerate(courseworks):
-            self.courseworks_table.setItem(i, 0, QTableWidgetItem(cw.get("title", "")))
-            self.courseworks_table.setItem(i, 1, QTableWidgetItem(cw.get("semester", "")))
-            self.courseworks_table.setItem(i, 2, QTableWidgetItem(", ".join(cw.get("technologies", []))))
+        _fill_table(self.courseworks_table, self.courseworks_model, self._read("courseworks"))
 
     def add_coursework(self):
         dialog = CourseworkDialog(self, "Добавить курсовую работу")
         if dialog.exec():
-            data = dialog.get_coursework_data()
-            courseworks = self.manager.read_courseworks()
+            data = dialog.get_data()
+            courseworks = self._read("courseworks")
             data["id"] = len(courseworks) + 1
-            courseworks.append(data)
-            if self.manager.write_courseworks(courseworks):
-                self.refresh_courseworks()
+            courseworks = [*courseworks, data]
+            self._queue_write("courseworks", courseworks)
 
     def edit_coursework(self):
-        row = self.courseworks_table.currentRow()
+        row = self.courseworks_table.currentIndex().row()
         if row < 0:
             QMessageBox.warning(self, "Внимание", "Выберите курсовую работу для редактирования")
             return
-        courseworks = self.manager.read_courseworks()
+        courseworks = self._read("courseworks")
         if row >= len(courseworks):
             return
         dialog = CourseworkDialog(self, "Редактировать курсовую работу", courseworks[row])
         if dialog.exec():
-            updated = dialog.get_coursework_data()
+            updated = dialog.get_data()
             updated["id"] = courseworks[row]["id"]
-            courseworks[row] = updated
-            if self.manager.write_courseworks(courseworks):
-                self.refresh_courseworks()
+            if updated == courseworks[row]:
+                return
+            courseworks = courseworks[:row] + [updated] + courseworks[row + 1:]
+            self._queue_write("courseworks", courseworks)
 
     def delete_coursework(self):
-        row = self.courseworks_table.currentRow()
+        row = self.courseworks_table.currentIndex().row()
         if row < 0:
             return
         reply = QMessageBox.question(self, "Подтверждение", "Вы уверены, что хотите удалить эту курсовую работу?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            courseworks = self.manager.read_courseworks()
+            courseworks = self._read("courseworks")
             if row < len(courseworks):
-                courseworks.pop(row)
-                if self.manager.write_courseworks(courseworks):
-                    self.refresh_courseworks()
+                courseworks = courseworks[:row] + courseworks[row + 1:]
+                self._queue_write("courseworks", courseworks)
 
     # Practical Works Methods
     def refresh_practical_works(self):
-        practical_works = self.manager.read_practical_works()
-        self.practical_table.setRowCount(len(practical_works))
-        for i, pw in enumerate(practical_works):
-            self.practical_table.setItem(i, 0, QTableWidgetItem(pw.get("title", "")))
-            self.practical_table.setItem(i, 1, QTableWidgetItem(pw.get("semester", "")))
-            self.practical_table.setItem(i, 2, QTableWidgetItem(str(len(pw.get("items", [])))))
+        _fill_table(self.practical_table, self.practical_model, self._read("practical_works"))
 
     def add_practical_work(self):
         dialog = PracticalWorkDialog(self, "Добавить практические работы")
         if dialog.exec():
-            data = dialog.get_practical_data()
-            practical_works = self.manager.read_practical_works()
+            data = dialog.get_data()
+            practical_works = self._read("practical_works")
             data["id"] = len(practical_works) + 1
-            practical_works.append(data)
-            if self.manager.write_practical_works(practical_works):
-                self.refresh_practical_works()
+            practical_works = [*practical_works, data]
+            self._queue_write("practical_works", practical_works)
 
     def edit_practical_work(self):
-        row = self.practical_table.currentRow()
+        row = self.practical_table.currentIndex().row()
         if row < 0:
             QMessageBox.warning(self, "Внимание", "Выберите практические работы для редактирования")
             return
-        practical_works = self.manager.read_practical_works()
+        practical_works = self._read("practical_works")
         if row >= len(practical_works):
             return
         dialog = PracticalWorkDialog(self, "Редактировать практические работы", practical_works[row])
         if dialog.exec():
-            updated = dialog.get_practical_data()
+            updated = dialog.get_data()
             updated["id"] = practical_works[row]["id"]
-            practical_works[row] = updated
-            if self.manager.write_practical_works(practical_works):
-                self.refresh_practical_works()
+            if updated == practical_works[row]:
+                return
+            practical_works = practical_works[:row] + [updated] + practical_works[row + 1:]
+            self._queue_write("practical_works", practical_works)
 
     def delete_practical_work(self):
-        row = self.practical_table.currentRow()
+        row = self.practical_table.currentIndex().row()
         if row < 0:
             return
         reply = QMessageBox.question(self, "Подтверждение", "Вы уверены, что хотите удалить эти практические работы?",
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            practical_works = self.manager.read_practical_works()
+            practical_works = self._read("practical_works")
             if row < len(practical_works):
-                practical_works.pop(row)
-                if self.manager.write_practical_works(practical_works):
-                    self.refresh_practical_works()
+                practical_works = practical_works[:row] + practical_works[row + 1:]
+                self._queue_write("practical_works", practical_works)
 
     # Deploy Methods
     def deploy_changes(self):
@@ -1405,56 +1688,78 @@ class PortfolioApp(QMainWindow):
         self.deploy_status.setText("🔄 Загрузка изменений в GitHub...")
         self.deploy_btn.setEnabled(False)
         self.deploy_progress.setValue(0)
-        self._setup_deploy_worker(commit_msg)
-
-    def _setup_deploy_worker(self, commit_msg: str):
-        self.worker = DeployWorker(self.manager, commit_msg)
-        self.thread = QThread()
-        self.worker.moveToThread(self.thread)
-        self.worker.finished.connect(self._deploy_finished)
-        self.thread.started.connect(self.worker.run)
-        self.thread.start()
-        from PyQt6.QtCore import QTimer
-        self._prog = 0
-        self.progress_timer = QTimer()
-        self.progress_timer.timeout.connect(self._advance_progress)
-        self.progress_timer.start(120)
-
-    def _advance_progress(self):
-        if self._prog < 95:
-            self._prog += 4
-            self.deploy_progress.setValue(self._prog)
-        else:
-            if hasattr(self, 'progress_timer') and self.progress_timer.isActive():
-                self.progress_timer.stop()
+
+        # Deploy must see every saved change on disk
+        self._wait_for_writes()
+        runnable = DeployRunnable(self.manager, commit_msg)
+        runnable.signals.progress.connect(self._deploy_progress)
+        runnable.signals.finished.connect(self._deploy_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _deploy_progress(self, percent: int, message: str):
+        self.deploy_progress.setValue(percent)
+        self.deploy_status.setText(message)
 
     def _deploy_finished(self, ok: bool):
-        if hasattr(self, 'progress_timer') and self.progress_timer.isActive():
-            self.progress_timer.stop()
         self.deploy_progress.setValue(100 if ok else 0)
         self.deploy_status.setText("✅ Изменения успешно загружены в GitHub!" if ok else "❌ Ошибка при загрузке изменений")
         self.deploy_btn.setEnabled(True)
-        if hasattr(self, 'thread'):
-            self.thread.quit()
-            self.thread.wait()
-        self.worker = None
-        self.thread = None
 
-class DeployWorker(QObject):
+class DeploySignals(QObject):
+    progress = pyqtSignal(int, str)
     finished = pyqtSignal(bool)
+
+class DeployRunnable(QRunnable):
+    """Runs deploy_to_github on the global thread pool; results arrive through signals"""
+
     def __init__(self, manager: PortfolioManager, commit_message: str):
         super().__init__()
         self.manager = manager
         self.commit_message = commit_message
+        # QRunnable is not a QObject, so the signals live on a companion object
+        self.signals = DeploySignals()
+
+    def run(self):
+        ok = self.manager.deploy_to_github(self.commit_message, self.signals.progress.emit)
+        self.signals.finished.emit(ok)
+
+class _WriteSignals(QObject):
+    done = pyqtSignal(str, object, bool)
+
+class _WriteRunnable(QRunnable):
+    """Writes one data file on PortfolioApp's writer pool"""
+
+    def __init__(self, data_file: _JsonFile, kind: str, data: Any):
+        super().__init__()
+        self.data_file = data_file
+        self.kind = kind
+        self.data = data
+        self.signals = _WriteSignals()
 
-    @pyqtSlot()
     def run(self):
-        ok = self.manager.deploy_to_github(self.commit_message)
-        self.finished.emit(ok)
+        # Errors are logged by _JsonFile.write; the result goes back to the GUI thread
+        ok = self.data_file.write(self.data)
+        self.signals.done.emit(self.kind, self.data, ok)
+
+class _OpenUrlRunnable(QRunnable):
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+
+    def run(self):
+        webbrowser.open(self.url)
 
 def main():
     repo_path = os.path.dirname(os.path.abspath(__file__))
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(ColoredFormatter())
+    logger = logging.getLogger("portfolio")
+    logger.addHandler(console)
+    logger.setLevel(logging.INFO)
+
     app = QApplication(sys.argv)
+    app.setStyleSheet(_MAIN_QSS + _NAV_QSS)
     win = PortfolioApp(repo_path)
     win.show()
     sys.exit(app.exec())